@@ -38,8 +38,19 @@ except:
     print('Did not find a text file containing file names (perhaps name does not match)')
     sys.exit()
 
+#draw every map_stride-th pixel on maps (1 draws every pixel)
+map_stride=1
+
 # =============================================================================
 
+#the map projection, AQI bins and colormap are the same for every file, so build them once
+#(upper bin edges are inclusive)
+plate_carree=ccrs.PlateCarree()
+aqi_bins=np.array([12,35.4,55.4,150.4,250.4])
+my_cmap=LinearSegmentedColormap.from_list('mycmap', ['green','yellow','orange','red','purple','brown'],6)
+#AQI categories are stored as uint8 with 255 for pixels without data; 255 is above the color limits
+#of the map, so these pixels are drawn in the "over" color, which is transparent
+my_cmap.set_over(color='white',alpha=0.0)
 
 #loops through all files listed in the text file
 for FILE_NAME in fileList:
@@ -57,6 +68,23 @@ for FILE_NAME in fileList:
         else:#if it is neither 3km nor 10km, then this will skip the rest of this loop iteration
             print('The file :',FILE_NAME, ' is not a valid MODIS file (Or is named incorrectly). \n')
             continue
+        #Asks user what they would like to do before reading the file
+        is_stats=str(input('\nWould you like to see statistics of this data? Please enter Y or N \n'))
+        is_map=str(input('\nWould you like to create a map of this data? Please enter Y or N \n'))
+        want_stats=(is_stats == 'Y' or is_stats == 'y')
+        want_map=(is_map == 'Y' or is_map == 'y')
+        if not want_stats and not want_map:
+            continue
+        if want_map:
+            #asks user if they want to set PM2.5 calculation parameters
+            user_input=input('\nWould you like to enter a slope and intercept for PM 2.5 calculation?')
+            if user_input == 'Y' or user_input == 'y': 
+                slope=np.float32(input('Please enter a slope: '))
+                intercept=np.float32(input('Please enter an intercept: '))
+            else:
+                #if not, choose the following:
+                slope=np.float32(29.4)
+                intercept=np.float32(8.8)
         try:
             # open the hdf file for reading
             hdf=SD.SD(FILE_NAME)
@@ -93,60 +121,48 @@ for FILE_NAME in fileList:
         
         #get SDS data
         data=sds.get()
-        #get data within valid range
-        valid_data=data.ravel()
-        valid_data=[x for x in valid_data if x>=min_range]
-        valid_data=[x for x in valid_data if x<=max_range]
-        valid_data=np.asarray(valid_data)
-        #scale the valid data
-        valid_data=valid_data*scale_factor
-        #find the average
-        average=sum(valid_data)/len(valid_data)
-        #find the standard deviation
-        stdev=np.std(valid_data)
-        #print information
-        print('\nThe valid range of values is: ',round(min_range*scale_factor,3), ' to ',round(max_range*scale_factor,3),'\nThe average is: ',round(average,3),'\nThe standard deviation is: ',round(stdev,3))
-        print('The range of latitude in this file is: ',min_lat,' to ',max_lat, 'degrees \nThe range of longitude in this file is: ',min_lon, ' to ',max_lon,' degrees')
-        
-
-        #asks user if they want to set PM2.5 calculation parameters
-        user_input=input('\nWould you like to enter a slope and intercept for PM 2.5 calculation?')
-        if user_input == 'Y' or user_input == 'y': 
-            slope=input('Please enter a slope: ')
-            intercept=input('Please enter an intercept: ')
-        else:
-            #if not, choose the following:
-            slope=29.4
-            intercept=8.8
-        valid_data=data*scale_factor
-        pm25=float(slope)*valid_data+float(intercept)
         
+        if want_stats:
+            #get data within valid range and scale it
+            valid_data=data[(data>=min_range)&(data<=max_range)]*scale_factor
+            #find the average
+            average=valid_data.mean()
+            #find the standard deviation
+            stdev=valid_data.std()
+            #print information
+            print('\nThe valid range of values is: ',round(min_range*scale_factor,3), ' to ',round(max_range*scale_factor,3),'\nThe average is: ',round(average,3),'\nThe standard deviation is: ',round(stdev,3))
+            print('The range of latitude in this file is: ',min_lat,' to ',max_lat, 'degrees \nThe range of longitude in this file is: ',min_lon, ' to ',max_lon,' degrees')
         
-        
-        #Asks user if they would like to see a map
-        is_map=input('\nWould you like to create a map of this data? Please enter Y or N \n')
         #if user would like a map, view it
-        if is_map == 'Y' or is_map == 'y':
-            
-            #turn fillvalues to NaN
-            data=pm25.astype(float)
-            data[np.logical_and(data>=0,data <= 12)]=0
-            data[np.logical_and(data>12,data <= 35.4)]=1
-            data[np.logical_and(data>35.4,data <= 55.4)]=2
-            data[np.logical_and(data>55.4,data <= 150.4)]=3
-            data[np.logical_and(data>150.4,data <= 250.4)]=4
-            data[data>250.4]=5
-            data[data < 0] = np.nan
-            
-            #create the map
-            data = np.ma.masked_array(data, np.isnan(data))
+        if want_map:
+            #keep everything in float32 and combine the scale factor and slope into one constant,
+            #so PM 2.5 takes one multiply and one add per pixel
+            factor=np.float32(scale_factor)*slope
+            #int16 AOD has only 65536 possible raw values, so their AQI categories are worked out once (a lookup
+            #table indexed by the raw bits read as uint16); any other data type is classified pixel by pixel
+            is_int16=(data.dtype == np.int16)
+            if is_int16:
+                values=np.arange(65536,dtype=np.uint16).view(np.int16)
+            else:
+                values=data
+            pm25=values.astype(np.float32)
+            np.multiply(pm25,factor,out=pm25)
+            np.add(pm25,intercept,out=pm25)
+            #sort PM 2.5 into AQI categories 0-5
+            aqi=np.digitize(pm25,aqi_bins,right=True).astype(np.uint8)
+            #mark fillvalues (negative PM 2.5) with 255
+            aqi[pm25 < 0] = 255
+            if is_int16:
+                data=aqi[data.view(np.uint16)]
+            else:
+                data=aqi
             
+            #create the map (pixels without data are 255 and drawn transparent, so no masked array is needed)
             extent = (min_lon, max_lon, min_lat, max_lat)
-            m = plt.axes(projection=ccrs.PlateCarree())
+            m = plt.axes(projection=plate_carree)
             m.set_extent(extent)
             
-            my_cmap=LinearSegmentedColormap.from_list('mycmap', ['green','yellow','orange','red','purple','brown'],6)
-            plt.pcolormesh(longitude, latitude, data,cmap=my_cmap, transform=ccrs.PlateCarree())
+            plt.pcolormesh(longitude[::map_stride,::map_stride], latitude[::map_stride,::map_stride], data[::map_stride,::map_stride],cmap=my_cmap, transform=plate_carree)
             plt.clim(0,6)
              
             #create colorbar
@@ -156,7 +172,7 @@ for FILE_NAME in fileList:
             cb.set_ticklabels(['Good', 'Moderate', 'Unhealthy for \nSensitive Groups','Unhealthy','Very Unhealthy','Hazardous'])  # put text labels on them
             
             m.coastlines()
-            grd = m.gridlines(crs=ccrs.PlateCarree(), draw_labels=True, linewidth=2, color='gray', alpha=0.5, linestyle='--')
+            grd = m.gridlines(crs=plate_carree, draw_labels=True, linewidth=2, color='gray', alpha=0.5, linestyle='--')
             grd.xlabels_top = None
             grd.ylabels_right = None
             grd.xformatter = LONGITUDE_FORMATTER
@@ -0,0 +1,88 @@
+#!/usr/bin/python
+'''
+Module: read_mod_aerosol_and_print_statistics.py
+==========================================================================================
+Disclaimer: The code is for demonstration purposes only. Users are responsible to check for accuracy and revise to fit their objective.
+
+Organization:               NASA ARSET
+
+Purpose: To print the AOD statistics (valid range, average, standard deviation) and the latitude and
+longitude ranges of a series of MODIS HDF4 files without any prompts. Every file is independent, so
+the files are processed in parallel, one per CPU core. Use read_and_map_mod_aerosol.py to make maps.
+==========================================================================================
+'''
+
+from pyhdf import SD
+import numpy as np
+import sys
+from multiprocessing import Pool
+
+
+def process_file(FILE_NAME):
+    #reads one MODIS file and returns a dictionary with its statistics, or with an 'error' message
+    if '3K' in FILE_NAME:#then this is a 3km MODIS file
+        SDS_NAME='Optical_Depth_Land_And_Ocean' # The name of the sds to read
+    elif 'L2' in FILE_NAME: #Same as above but for 10km MODIS file
+        SDS_NAME='AOD_550_Dark_Target_Deep_Blue_Combined'
+    else:
+        return {'file':FILE_NAME,'error':'not a valid MODIS file (Or is named incorrectly)'}
+    try:
+        # open the hdf file for reading
+        hdf=SD.SD(FILE_NAME)
+    except:
+        return {'file':FILE_NAME,'error':'unable to open file'}
+    #read errors are returned for this file only, and the file is closed on every path
+    try:
+        try:
+            sds=hdf.select(SDS_NAME)
+        except:
+            return {'file':FILE_NAME,'error':'the file does not contain the SDS: '+SDS_NAME}
+        lat = hdf.select('Latitude')
+        latitude = lat[:]
+        lon = hdf.select('Longitude')
+        longitude = lon[:]
+        #get scale factor and valid range for AOD SDS
+        scale_factor=sds.attributes()['scale_factor']
+        range=sds.getrange()
+        min_range=min(range)
+        max_range=max(range)
+        data=sds.get()
+    except Exception as err:
+        return {'file':FILE_NAME,'error':'unable to read the file ('+str(err)+')'}
+    finally:
+        hdf.end()
+    #get data within valid range and scale it
+    valid_data=data[(data>=min_range)&(data<=max_range)]*scale_factor
+    if valid_data.size==0:
+        return {'file':FILE_NAME,'error':'no valid data in the SDS: '+SDS_NAME}
+    return {'file':FILE_NAME,
+            'min_valid':min_range*scale_factor,'max_valid':max_range*scale_factor,
+            'average':valid_data.mean(),'stdev':valid_data.std(),
+            'min_lat':latitude.min(),'max_lat':latitude.max(),'min_lon':longitude.min(),'max_lon':longitude.max()}
+
+
+#the worker processes import this file, so the file list is only read and processed by the main process
+if __name__ == '__main__':
+    # =============================================================================
+    # Inputs
+    #This uses the file "fileList.txt", containing the list of files, in order to read the files
+    try:
+        fileList=open('fileList.txt','r')
+    except:
+        print('Did not find a text file containing file names (perhaps name does not match)')
+        sys.exit()
+
+    # =============================================================================
+
+    FILE_NAMES=[FILE_NAME.strip() for FILE_NAME in fileList if FILE_NAME.strip()]
+    #results are printed as soon as each file is done, so they may not follow the order of the list
+    with Pool() as pool:
+        for result in pool.imap_unordered(process_file,FILE_NAMES):
+            if 'error' in result:
+                print('\n' + result['file'] + '\n Skipping: ' + result['error'])
+                continue
+            print('\n' + result['file'])
+            print('The valid range of values is: ',round(result['min_valid'],3), ' to ',round(result['max_valid'],3),'\nThe average is: ',round(result['average'],3),'\nThe standard deviation is: ',round(result['stdev'],3))
+            print('The range of latitude in this file is: ',result['min_lat'],' to ',result['max_lat'], 'degrees \nThe range of longitude in this file is: ',result['min_lon'], ' to ',result['max_lon'],' degrees')
+
+    print('\nAll valid files have been processed.')